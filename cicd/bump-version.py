@@ -6,15 +6,22 @@ import os
 import re
 import sys
 from pathlib import Path
-from typing import Optional
+
+# Basic semver format (X.Y.Z)
+_SEMVER_PATTERN: re.Pattern[str] = re.compile(r"\d+\.\d+\.\d+")
+
+# The version line under [project] in pyproject.toml
+_PYPROJECT_VERSION_PATTERN: re.Pattern[str] = re.compile(r'^(version\s*=\s*")[^"]+(")', flags=re.MULTILINE)
+
+# The __version__ line in memorylake/__init__.py
+_INIT_VERSION_PATTERN: re.Pattern[str] = re.compile(r'^(__version__\s*:\s*str\s*=\s*")[^"]+(")$', flags=re.MULTILINE)
 
 
 def validate_version(version: str) -> bool:
     """
     Validate that the version string follows basic semver format (X.Y.Z).
     """
-    pattern: str = r"^\d+\.\d+\.\d+$"
-    return bool(re.match(pattern, version))
+    return _SEMVER_PATTERN.fullmatch(version) is not None
 
 
 def update_pyproject_version(new_version: str) -> None:
@@ -27,15 +34,16 @@ def update_pyproject_version(new_version: str) -> None:
 
     content: str = pyproject_path.read_text()
 
-    # Use regex to replace the version line under [project]
-    pattern: str = r'^(version\s*=\s*")[^"]+(")'
-    match: Optional[re.Match[str]] = re.search(pattern, content, flags=re.MULTILINE)
+    # Replace the version line under [project] in a single regex pass
+    new_content: str
+    count: int
+    new_content, count = _PYPROJECT_VERSION_PATTERN.subn(rf"\g<1>{new_version}\g<2>", content)
 
-    if not match:
+    if count == 0:
         raise ValueError("Could not find version field in pyproject.toml")
 
-    new_content: str = re.sub(pattern, rf"\g<1>{new_version}\g<2>", content, flags=re.MULTILINE)
-    pyproject_path.write_text(new_content)
+    if new_content != content:
+        pyproject_path.write_text(new_content)
     print(f"Updated pyproject.toml: version = \"{new_version}\"")
 
 
@@ -49,15 +57,16 @@ def update_init_version(new_version: str) -> None:
 
     content: str = init_path.read_text()
 
-    # Use regex to replace the __version__ line
-    pattern: str = r'^(__version__\s*:\s*str\s*=\s*")[^"]+(")$'
-    match: Optional[re.Match[str]] = re.search(pattern, content, flags=re.MULTILINE)
+    # Replace the __version__ line in a single regex pass
+    new_content: str
+    count: int
+    new_content, count = _INIT_VERSION_PATTERN.subn(rf"\g<1>{new_version}\g<2>", content)
 
-    if not match:
+    if count == 0:
         raise ValueError("Could not find __version__ field in memorylake/__init__.py")
 
-    new_content: str = re.sub(pattern, rf"\g<1>{new_version}\g<2>", content, flags=re.MULTILINE)
-    init_path.write_text(new_content)
+    if new_content != content:
+        init_path.write_text(new_content)
     print(f"Updated memorylake/__init__.py: __version__ = \"{new_version}\"")
 
 
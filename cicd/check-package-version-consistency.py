@@ -2,21 +2,14 @@
 
 from __future__ import annotations
 
-import importlib.util
+import ast
+import functools
 import os
 import subprocess
 import sys
 from pathlib import Path
-from types import ModuleType
 from typing import Any, Union
 
-# Import ModuleSpec for type hints
-if sys.version_info >= (3, 11):
-    from importlib.machinery import ModuleSpec
-else:
-    # For Python 3.9-3.10, use Any as fallback since ModuleSpec might not be properly exposed
-    ModuleSpec = Any
-
 # Use tomllib (Python 3.11+) or tomli (Python 3.9-3.10) for TOML parsing
 if sys.version_info >= (3, 11):
     import tomllib
@@ -45,31 +38,37 @@ def read_version_from_pyproject() -> str:
 
 def read_version_from_init() -> str:
     """
-    Read version from memorylake/__init__.py by importing the module.
+    Read version from memorylake/__init__.py by parsing (not importing) the module.
     """
     init_path: Path = Path("memorylake/__init__.py")
     if not init_path.exists():
         raise FileNotFoundError("memorylake/__init__.py not found")
 
-    # Load the module dynamically
-    spec: Union[ModuleSpec, None] = importlib.util.spec_from_file_location("memorylake", init_path)
-    if spec is None or spec.loader is None:
-        raise ValueError("Failed to load memorylake/__init__.py")
+    # Parse the module instead of executing it, so we do not pay for importing the whole package
+    module: ast.Module = ast.parse(init_path.read_text(), filename=str(init_path))
+    for node in module.body:
+        target: Union[ast.expr, None]
+        value: Union[ast.expr, None]
+        if isinstance(node, ast.AnnAssign):
+            target, value = node.target, node.value
+        elif isinstance(node, ast.Assign) and len(node.targets) == 1:
+            target, value = node.targets[0], node.value
+        else:
+            continue
 
-    module: ModuleType = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
+        if isinstance(target, ast.Name) and target.id == "__version__":
+            if not isinstance(value, ast.Constant) or not isinstance(value.value, str):
+                raise ValueError("__version__ in memorylake/__init__.py is not a string literal")
+            return value.value
 
-    # Get __version__ attribute
-    version: Union[str, None] = getattr(module, "__version__", None)
-    if version is None:
-        raise ValueError("__version__ not found in memorylake/__init__.py")
-
-    return version
+    raise ValueError("__version__ not found in memorylake/__init__.py")
 
 
+@functools.cache
 def get_git_version_tags() -> list[str]:
     """
     Get git tags using 'git tag --points-at HEAD'.
+    The result is memoized, since HEAD does not move while this script runs.
     """
     try:
         result: subprocess.CompletedProcess[str] = subprocess.run(
@@ -77,6 +76,8 @@ def get_git_version_tags() -> list[str]:
             capture_output=True,
             text=True,
             check=True,
+            # Read-only query: do not let git take optional locks (e.g. to refresh the index)
+            env={**os.environ, "GIT_OPTIONAL_LOCKS": "0"},
         )
 
         tags: list[str] = result.stdout.strip().split("\n")
@@ -117,7 +118,7 @@ def main() -> int:
         return 1
 
     git_tags: list[str] = get_git_version_tags()
-    if len(git_tags) >= 0:
+    if len(git_tags) > 0:
         print(f"Version in git tag(s): {git_tags!r}")
     else:
         print("No git tag(s) found")
@@ -133,17 +134,16 @@ def main() -> int:
     if len(git_tags) == 0:
         errors.append(f"No git tag version found. Version must be checked with git tagging")
     else:
-        def __is_version_in_git_tags(version: str) -> bool:
-            for git_tag in git_tags:
-                if git_tag == version or git_tag == f"v{version}":
-                    return True
-            return False
-
-        # Check if the pyproject/init version matches any of the git tags
-        if not __is_version_in_git_tags(pyproject_version):
+        # Both "X.Y.Z" and "vX.Y.Z" tags are accepted
+        git_tag_versions: frozenset[str] = frozenset(git_tags) | frozenset(
+            git_tag[1:] for git_tag in git_tags if git_tag.startswith("v"))
+
+        # Check if the pyproject version matches any of the git tags.
+        # pyproject.toml is the source of truth: __init__.py only needs its own check if it differs from it.
+        if pyproject_version not in git_tag_versions:
             errors.append(f"Version mismatch: pyproject.toml ({pyproject_version!r}) not in git tags ({git_tags!r})")
 
-        if not __is_version_in_git_tags(init_version):
+        if init_version != pyproject_version and init_version not in git_tag_versions:
             errors.append(f"Version mismatch: memorylake/__init__.py ({init_version}) not in git tags ({git_tags!r})")
 
     if len(errors) > 0:
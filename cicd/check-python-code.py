@@ -2,56 +2,83 @@
 
 from __future__ import annotations
 
-import glob
+import bisect
+import contextlib
+import functools
 import io
-import itertools
 import os
 import re
+import sys
 import tokenize
 from abc import ABC
 from collections import defaultdict
-from collections.abc import Iterator
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from tokenize import TokenInfo
-from typing import Union
+from typing import Optional, Union
 
 TokenType = int
 
+# Matches `noqa(rule-a, rule-b)` anywhere in a comment
+_NOQA_PATTERN: re.Pattern[str] = re.compile(r"noqa\(([^)]+)\)")
+
+# Matches a warning class name, like `DeprecationWarning`
+_WARNING_CLASS_PATTERN: re.Pattern[str] = re.compile(r"\w*Warning")
+
 
 class TokenSequence:
-    def __init__(self, tokens: list[TokenInfo], token_indexes: list[int], sentinel_token: TokenInfo):
-        self.tokens = tokens
-        self.token_indexes = token_indexes
+    # Number of sentinel tokens padded at both ends, i.e. how far a matcher may look behind/ahead of the tokens
+    PADDING: int = 16
+
+    def __init__(self, tokens: list[TokenInfo], sentinel_token: TokenInfo):
+        # Pad with sentinel tokens, so that reading slightly out of range needs no bounds check
+        self.padded_tokens = [sentinel_token] * self.PADDING + tokens + [sentinel_token] * self.PADDING
         self.sentinel_token = sentinel_token
         self.cursor = 0
 
     def __getitem__(self, offset: int) -> TokenInfo:
-        at = self.cursor + offset
-        if at < 0:
-            return self.sentinel_token
-        elif at >= len(self.token_indexes):
-            return self.sentinel_token
-        else:
-            return self.tokens[self.token_indexes[at]]
+        return self.padded_tokens[self.cursor + offset + self.PADDING]
 
 
 class SourceFile:
     def __init__(self, file: str):
         self.file: str = file
 
-        with io.open(file, "r") as fp:
-            self.lines: list[str] = [line[:-1] for line in fp.readlines()]
-
-        with io.open(file, "rb") as fp:
-            self.tokens: list[TokenInfo] = [t for t in tokenize.tokenize(fp.readline)]
+        # Read the file only once, and tokenize from the in-memory buffer
+        data: bytes = Path(file).read_bytes()
+        self.tokens: list[TokenInfo] = list(tokenize.tokenize(io.BytesIO(data).readline))
 
         self.sentinel_token: TokenInfo = self.tokens[0]
         assert self.sentinel_token.type == tokenize.ENCODING
 
-        self.tokens_by_line: defaultdict[int, list[TokenInfo]] = defaultdict(list)
-        for token in self.tokens:
-            for line in range(token.start[0], token.end[0] + 1):
-                self.tokens_by_line[line].append(token)
+        # The ENCODING token tells us how the tokenizer decoded the file, so decode the lines the same way
+        text: str = data.decode(self.sentinel_token.string)
+        # Split on the newlines the tokenizer recognizes (\r\n, \r, \n) only: `str.splitlines` also splits on
+        # form feeds and other separators, which would put `lines` out of step with the token line numbers
+        self.lines: list[str] = io.StringIO(text, newline=None).read().split("\n")
+        if self.lines[-1] == "":
+            # The file ends with a newline (or is empty), which does not start another line
+            self.lines.pop()
+
+    # Start and end line of each token, both non-decreasing, so the tokens overlapping a line range can be
+    # found with bisect (instead of indexing every line a multi-line token spans).
+    # They are only needed when something matched, so they are built lazily.
+    @functools.cached_property
+    def token_start_lines(self) -> list[int]:
+        return [token.start[0] for token in self.tokens]
+
+    @functools.cached_property
+    def token_end_lines(self) -> list[int]:
+        return [token.end[0] for token in self.tokens]
+
+    def tokens_in_lines(self, from_line: int, to_line: int) -> list[TokenInfo]:
+        """
+        Returns all tokens overlapping with lines [from_line, to_line].
+        """
+        begin = bisect.bisect_left(self.token_end_lines, from_line)
+        end = bisect.bisect_right(self.token_start_lines, to_line)
+        return self.tokens[begin:end]
 
 
 class Checker:
@@ -62,10 +89,12 @@ class Checker:
         self._ignore_comments: bool = ignore_comments
 
         if self._ignore_comments:
-            self.token_indexes = [idx for idx in range(len(srcfile.tokens))
-                                  if srcfile.tokens[idx].type not in {tokenize.COMMENT}]
+            self.filtered_tokens: list[TokenInfo] = [token for token in srcfile.tokens
+                                                     if token.type not in {tokenize.COMMENT}]
         else:
-            self.token_indexes = list(range(len(srcfile.tokens)))  # [0, 1, ..., len(srcfile.tokens)-1]
+            self.filtered_tokens = srcfile.tokens
+
+        self._indexes_by_string: Optional[defaultdict[str, list[int]]] = None
 
     def match_on(self, matcher_list: list[Matcher]) -> None:
         self._matcher_list_list.append(matcher_list)
@@ -74,21 +103,38 @@ class Checker:
         if token.type not in {tokenize.COMMENT} or "noqa" not in token.string:
             return False
 
-        match = re.fullmatch(r".*noqa\(([^)]+)\).*", token.string)
+        match = _NOQA_PATTERN.search(token.string)
         if not match:
             return False
         nolint_str = match.group(1)
         suppressed_checks = [s.strip() for s in nolint_str.split(',')]
         return self._rule_name in suppressed_checks
 
+    def _get_indexes_by_string(self) -> dict[str, list[int]]:
+        """
+        Returns an inverted index from token string to the positions (in `filtered_tokens`) where it appears.
+        """
+        if self._indexes_by_string is None:
+            self._indexes_by_string = defaultdict(list)
+            for index, token in enumerate(self.filtered_tokens):
+                self._indexes_by_string[token.string].append(index)
+        return self._indexes_by_string
+
     def __iter__(self) -> Iterator[tuple[TokenInfo, TokenInfo]]:
+        token_seq = TokenSequence(self.filtered_tokens, self._srcfile.sentinel_token)
         for matcher_list in self._matcher_list_list:
-            index = 0  # next index of token to try matching
+            assert len(matcher_list) >= 1
 
-            token_seq = TokenSequence(self._srcfile.tokens, self.token_indexes, self._srcfile.sentinel_token)
-            while True:
-                assert len(matcher_list) >= 1
-                if index + len(matcher_list) >= len(self.token_indexes):
+            # If the first matcher can only match a literal token, just try the positions where that token appears
+            anchor: Optional[str] = matcher_list[0].first_literal()
+            start_indexes: Iterable[int]
+            if anchor is not None:
+                start_indexes = self._get_indexes_by_string().get(anchor, [])
+            else:
+                start_indexes = range(len(self.filtered_tokens))
+
+            for index in start_indexes:
+                if index + len(matcher_list) >= len(self.filtered_tokens):
                     break
 
                 cursor = index
@@ -96,19 +142,15 @@ class Checker:
                     token_seq.cursor = cursor
                     matcher_result: int = matcher(token_seq)
                     if matcher_result < 0:
-                        index += 1
                         break
                     else:  # matcher_result >= 0
                         cursor += matcher_result
                 else:
                     assert cursor > index
-                    from_token = self._srcfile.tokens[self.token_indexes[index]]
-                    to_token = self._srcfile.tokens[self.token_indexes[cursor - 1]]
-                    index += 1
+                    from_token = self.filtered_tokens[index]
+                    to_token = self.filtered_tokens[cursor - 1]
 
-                    for token in itertools.chain(*(self._srcfile.tokens_by_line[line_num]
-                                                   for line_num
-                                                   in range(from_token.start[0], to_token.end[0] + 1))):
+                    for token in self._srcfile.tokens_in_lines(from_token.start[0], to_token.end[0]):
                         if self._check_nolint_suppression(token):
                             # It's suppressed by comment...
                             break
@@ -122,10 +164,13 @@ class Checker:
         to_col = to_token.end[1] + 1
         assert (from_line, from_col) < (to_line, to_col)
 
+        # Collect all output lines and write them at once, instead of one print() per line
+        output_lines: list[str] = []
+
         file_and_pos = f"{self._srcfile.file}:{from_line}:{from_col}"
-        print(f"{prefix}Check \"{self._rule_name}\" at {file_and_pos}")
+        output_lines.append(f"{prefix}Check \"{self._rule_name}\" at {file_and_pos}")
         for message_per_line in message.splitlines(keepends=False):
-            print(f"{prefix}{message_per_line}")
+            output_lines.append(f"{prefix}{message_per_line}")
 
         for line in range(from_line, to_line + 1):
             # Expand TAB to a single space, so '^^^' markers work well with TAB character (though we shouldn't use TABs)
@@ -133,17 +178,20 @@ class Checker:
 
             prefix_line_num_str = f"line {line} |".rjust(11)
             prefix_line_num_space = "|".rjust(len(prefix_line_num_str))
-            print(f"{prefix}{prefix_line_num_str} {str_line}")
+            output_lines.append(f"{prefix}{prefix_line_num_str} {str_line}")
 
             if line == from_line and line == to_line:  # in a single line
-                print(f"{prefix}{prefix_line_num_space} {' ' * (from_col - 1)}{'^' * (to_col - from_col)}")
+                output_lines.append(f"{prefix}{prefix_line_num_space} {' ' * (from_col - 1)}{'^' * (to_col - from_col)}")
             elif line == from_line:  # across multiple lines, and this is the first line
-                print(f"{prefix}{prefix_line_num_space} {' ' * (from_col - 1)}{'^' * (len(str_line) - from_col + 1)}")
+                output_lines.append(
+                    f"{prefix}{prefix_line_num_space} {' ' * (from_col - 1)}{'^' * (len(str_line) - from_col + 1)}")
             elif line == to_line:  # across multiple lines, and this is the last line
-                print(f"{prefix}{prefix_line_num_space} {'^' * to_col}")
+                output_lines.append(f"{prefix}{prefix_line_num_space} {'^' * to_col}")
             else:  # across multiple lines, and this is a line in the middle
-                print(f"{prefix}{prefix_line_num_space} {'^' * len(str_line)}")
-        print()
+                output_lines.append(f"{prefix}{prefix_line_num_space} {'^' * len(str_line)}")
+        output_lines.append("")
+
+        sys.stdout.write("\n".join(output_lines) + "\n")
 
     def check(self, prefix, message):
         success = True
@@ -160,6 +208,12 @@ class Matcher(ABC):
         """
         raise NotImplementedError()
 
+    def first_literal(self) -> Optional[str]:
+        """
+        Returns the string the first matched token must be equal to, or None if it is not a fixed string.
+        """
+        return None
+
 
 class ExceptMatcher(Matcher):
     def __init__(self, base_matcher: Matcher, except_matcher: Matcher) -> None:
@@ -177,23 +231,34 @@ class ExceptMatcher(Matcher):
 
         return base_matcher_result
 
+    def first_literal(self) -> Optional[str]:
+        return self._base_matcher.first_literal()
+
 
 class TokenTextMatcher(Matcher):
     def __init__(self, tokens_text: list[Union[str, re.Pattern]]) -> None:
         assert len(tokens_text) > 0
         self._tokens_text = tokens_text
 
-    def __call__(self, token_seq: TokenSequence) -> int:
-        for i, token_text in enumerate(self._tokens_text):
+        # Resolve how to match each token once, so that matching does not need to dispatch on type per token
+        self._predicates: list[Callable[[str], object]] = []
+        for token_text in tokens_text:
             if isinstance(token_text, str):
-                if token_seq[i].string != token_text:
-                    return -1
+                self._predicates.append(token_text.__eq__)
             elif isinstance(token_text, re.Pattern):
-                if not token_text.fullmatch(token_seq[i].string):
-                    return -1
+                self._predicates.append(token_text.fullmatch)
             else:
                 raise TypeError(f"Invalid token_text type: {type(token_text)}")
-        return len(self._tokens_text)
+
+    def __call__(self, token_seq: TokenSequence) -> int:
+        for i, predicate in enumerate(self._predicates):
+            if not predicate(token_seq[i].string):
+                return -1
+        return len(self._predicates)
+
+    def first_literal(self) -> Optional[str]:
+        first_token_text = self._tokens_text[0]
+        return first_token_text if isinstance(first_token_text, str) else None
 
 
 class TokenTypeMatcher(Matcher):
@@ -228,35 +293,52 @@ class PythonExprMatcher(Matcher):
         if token_seq[-1].string not in (',', '('):
             return -1
 
+        # Bind module-level constants to locals, since this loop runs over every token of an argument
+        token_type_encoding = tokenize.ENCODING
+        token_type_op = tokenize.OP
+
         # Use a stack to keep track of nested function calls
         nested_parentheses = 0
         i = 0
         while True:
-            if token_seq[i].type == tokenize.ENCODING:
+            token = token_seq[i]
+            token_type = token.type
+            if token_type == token_type_encoding:
                 return -1
 
-            if nested_parentheses == 0:
-                # If we're not in a nested function call, and we see a comma or a closing parenthesis,
-                # we've found the end of the actual argument
-                if token_seq[i].type == tokenize.OP and token_seq[i].string in (",", ")"):
-                    return i
-
-            if token_seq[i].type == tokenize.OP and token_seq[i].string == '(':
-                nested_parentheses += 1
-            elif token_seq[i].type == tokenize.OP and token_seq[i].string == ')':
-                nested_parentheses -= 1
+            if token_type == token_type_op:
+                token_string = token.string
+                if nested_parentheses == 0:
+                    # If we're not in a nested function call, and we see a comma or a closing parenthesis,
+                    # we've found the end of the actual argument
+                    if token_string in (",", ")"):
+                        return i
+
+                if token_string == '(':
+                    nested_parentheses += 1
+                elif token_string == ')':
+                    nested_parentheses -= 1
             i += 1
 
 
+# Matchers are stateless, so the matcher lists of each rule are built once and shared by all files
+_SUPPRESS_WARNING_MATCHERS: list[Matcher] = [
+    TokenTextMatcher(["suppress", "(", _WARNING_CLASS_PATTERN]),
+]
+
+_TYPING_CAST_MATCHERS: list[Matcher] = [
+    TokenTextMatcher(["cast", "("]),
+    TokenTypeMatcher([tokenize.NAME]),
+]
+
+
 def do_check_suppress_warning(srcfile: SourceFile) -> bool:
     """
     Check that we do not use `contextlib.suppress(XxxWarning)`,
     use `warnings.catch_warnings(action="ignore", category=XxxWarning)` instead.
     """
     checker = Checker("ml-ignore-warning", srcfile, ignore_comments=True)
-    checker.match_on([
-        TokenTextMatcher(["suppress", "(", re.compile(".*Warning")]),
-    ])
+    checker.match_on(_SUPPRESS_WARNING_MATCHERS)
 
     return checker.check(
         "ERROR: ", "Please do not use `contextlib.suppress(XxxWarning)`; use `warnings.catch_warnings(...)` instead.")
@@ -268,21 +350,18 @@ def do_check_typing_cast(srcfile: SourceFile) -> bool:
     use `common.type_hints.safe_cast()` instead.
     """
     checker = Checker("ml-typing-cast", srcfile, ignore_comments=False)
-    checker.match_on([
-        TokenTextMatcher(["cast", "("]),
-        TokenTypeMatcher([tokenize.NAME]),
-    ])
+    checker.match_on(_TYPING_CAST_MATCHERS)
 
     return checker.check(
         "ERROR: ", "Please do not use `typing.cast(T, value)`, use `safe_cast(T, value)` instead.")
 
 
-def do_check_test_directory_name(srcfile: SourceFile) -> bool:
+def do_check_test_directory_name(file: str) -> bool:
     """
     Check that we always use "test" as test directory name.
     Do not use "tests" or "unittest" or anything else.
     """
-    srcfile_path: Path = Path(srcfile.file)
+    srcfile_path: Path = Path(file)
     parts_lower: list[str] = [part.lower() for part in srcfile_path.parts]
     disallowed_names: list[str] = ["tests", "unittest", "unit_test", "unittests", "unit_tests"]
     for disallowed_name in disallowed_names:
@@ -292,22 +371,50 @@ def do_check_test_directory_name(srcfile: SourceFile) -> bool:
     return True
 
 
+def _check_one_file(file: str) -> tuple[bool, str]:
+    """
+    Run all token-based checks on a single file (in a worker process).
+    Returns whether all checks passed, and the messages they printed.
+    """
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        srcfile = SourceFile(file)
+
+        success: bool = True
+        success = do_check_suppress_warning(srcfile) and success
+        success = do_check_typing_cast(srcfile) and success
+
+    return success, output.getvalue()
+
+
 def main():
     repo_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     os.chdir(repo_dir)
 
-    files: list[str] = []
-    for pattern in {"memorylake/**/*.py"}:
-        files += glob.glob(pattern, recursive=True)
+    files: list[str] = [
+        os.path.join(dirpath, filename)
+        for dirpath, _, filenames in os.walk("memorylake")
+        for filename in filenames
+        if filename.endswith(".py")
+    ]
 
     success: bool = True
+
+    # The test directory name check only looks at the path, so run it while listing the files,
+    # and do not spend time tokenizing files that are misplaced anyway
+    files_to_tokenize: list[str] = []
     for file in files:
-        # print(f"Checking {file}")
-        srcfile = SourceFile(file)
+        if do_check_test_directory_name(file):
+            files_to_tokenize.append(file)
+        else:
+            success = False
 
-        success = do_check_suppress_warning(srcfile) and success
-        success = do_check_typing_cast(srcfile) and success
-        success = do_check_test_directory_name(srcfile) and success
+    # Files are checked independently, so check them in parallel,
+    # but print the messages in the original file order to keep the output deterministic
+    with ProcessPoolExecutor() as executor:
+        for file_success, file_output in executor.map(_check_one_file, files_to_tokenize):
+            sys.stdout.write(file_output)
+            success = file_success and success
 
     return 0 if success else 1
 
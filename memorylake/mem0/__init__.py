@@ -1,2 +1,3 @@
+from memorylake.mem0.client._loop import run_with_uvloop as run_with_uvloop
 from memorylake.mem0.extend.main import AsyncMemoryLakeClient as AsyncMemoryClient
 from memorylake.mem0.extend.main import MemoryLakeClient as MemoryClient  # noqa
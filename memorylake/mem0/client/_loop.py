@@ -0,0 +1,26 @@
+import asyncio
+from collections.abc import Coroutine
+from typing import Any, TypeVar
+
+_T = TypeVar("_T")
+
+
+def run_with_uvloop(main: Coroutine[Any, Any, _T]) -> _T:
+    """
+    Run a coroutine like `asyncio.run(...)`, on uvloop's faster event loop if uvloop is installed (`pip install memorylake[uvloop]`).
+
+    Only the loop created for this call uses uvloop; the global event loop policy is left alone.
+
+    Args:
+        main: The coroutine to run, usually the program's entry point.
+
+    Returns:
+        The coroutine's result.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(main)
+
+    # uvloop.run() goes through asyncio.Runner(loop_factory=uvloop.new_event_loop) on Python 3.11+
+    return uvloop.run(main)
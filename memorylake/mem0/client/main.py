@@ -1,18 +1,31 @@
+import asyncio
 import logging
 import os
 import warnings
+from collections.abc import AsyncGenerator
 from typing import Any, NoReturn, Optional
 
 import httpx
 
 from memorylake.mem0.client.project import AsyncProject, Project
-from memorylake.mem0.client.utils import api_error_handler, safe_cast
+from memorylake.mem0.client.utils import (
+    api_error_handler,
+    decode_json,
+    get_shared_async_transport,
+    get_shared_transport,
+    safe_cast,
+)
 
 # Exception classes are referenced in docstrings only
 from memorylake.mem0.memory.telemetry import capture_client_event
 
 logger = logging.getLogger(__name__)
 
+# Connection settings for the HTTP clients created here; a user-supplied client keeps its own transport.
+# HTTP/2 multiplexes concurrent requests over one connection, and the keep-alive pool avoids repeated handshakes.
+_HTTP_TIMEOUT: httpx.Timeout = httpx.Timeout(300.0, connect=10.0)
+_HTTP_LIMITS: httpx.Limits = httpx.Limits(max_connections=100, max_keepalive_connections=50, keepalive_expiry=30.0)
+
 warnings.filterwarnings("default", category=DeprecationWarning)
 
 
@@ -46,6 +59,7 @@ class MemoryClient:
         org_id: Optional[str] = None,
         project_id: Optional[str] = None,
         client: Optional[httpx.Client] = None,
+        shared_transport: bool = False,
     ):
         """Initialize the MemoryClient.
 
@@ -60,11 +74,14 @@ class MemoryClient:
             client: A custom httpx.Client instance. If provided, it will be
                     used instead of creating a new one. Note that base_url and
                     headers will be set/overridden as needed.
+            shared_transport: If True (and no client is given), use the process-wide
+                    transport from get_shared_transport(), so that several
+                    clients share one connection pool.
 
         Raises:
             ValueError: If no API key is provided or found in the environment.
         """
-        self.api_key = api_key or os.getenv("MEM0_API_KEY")
+        self.api_key = api_key or os.environ.get("MEM0_API_KEY")
         self.host = host or "https://api.mem0.ai"
         self.org_id = org_id
         self.project_id = project_id
@@ -74,12 +91,20 @@ class MemoryClient:
 
         if client is not None:
             self.client = client
-            # Ensure the client has the correct base_url and headers
-            self.client.base_url = httpx.URL(self.host)
-            self.client.headers.update(
-                {
+            # Ensure the client has the correct base_url and headers, only touching them if they differ
+            if str(self.client.base_url).rstrip("/") != self.host.rstrip("/"):
+                self.client.base_url = httpx.URL(self.host)
+            authorization: str = f"Token {self.api_key}"
+            if self.client.headers.get("Authorization") != authorization:
+                self.client.headers["Authorization"] = authorization
+        elif shared_transport:
+            self.client = httpx.Client(
+                base_url=self.host,
+                headers={
                     "Authorization": f"Token {self.api_key}",
-                }
+                },
+                timeout=_HTTP_TIMEOUT,
+                transport=get_shared_transport(),
             )
         else:
             self.client = httpx.Client(
@@ -87,7 +112,9 @@ class MemoryClient:
                 headers={
                     "Authorization": f"Token {self.api_key}",
                 },
-                timeout=300,
+                timeout=_HTTP_TIMEOUT,
+                http2=True,
+                limits=_HTTP_LIMITS,
             )
         self.user_email = self._validate_api_key()
 
@@ -106,7 +133,7 @@ class MemoryClient:
         try:
             params = self._prepare_params()
             response = self.client.get("/v1/ping/", params=params)
-            data = response.json()
+            data = decode_json(response)
 
             response.raise_for_status()
 
@@ -170,7 +197,7 @@ class MemoryClient:
         if "metadata" in kwargs:
             del kwargs["metadata"]
         capture_client_event("client.add", self, {"keys": list(kwargs.keys()), "sync_type": "sync"})
-        return response.json()
+        return decode_json(response)
 
     @api_error_handler
     def get(self, memory_id: str) -> dict[str, Any]:
@@ -194,7 +221,7 @@ class MemoryClient:
         response = self.client.get(f"/v1/memories/{memory_id}/", params=params)
         response.raise_for_status()
         capture_client_event("client.get", self, {"memory_id": memory_id, "sync_type": "sync"})
-        return response.json()
+        return decode_json(response)
 
     @api_error_handler
     def get_all(self, **kwargs: Any) -> dict[str, Any]:
@@ -238,7 +265,7 @@ class MemoryClient:
                 "sync_type": "sync",
             },
         )
-        result = response.json()
+        result = decode_json(response)
 
         # Ensure v1.1 format (wrap raw list if needed)
         if isinstance(result, list):
@@ -284,7 +311,7 @@ class MemoryClient:
                 "sync_type": "sync",
             },
         )
-        result = response.json()
+        result = decode_json(response)
 
         # Ensure v1.1 format (wrap raw list if needed)
         if isinstance(result, list):
@@ -325,7 +352,7 @@ class MemoryClient:
         params = self._prepare_params()
         response = self.client.put(f"/v1/memories/{memory_id}/", json=payload, params=params)
         response.raise_for_status()
-        return response.json()
+        return decode_json(response)
 
     @api_error_handler
     def delete(self, memory_id: str) -> dict[str, Any]:
@@ -349,7 +376,7 @@ class MemoryClient:
         response = self.client.delete(f"/v1/memories/{memory_id}/", params=params)
         response.raise_for_status()
         capture_client_event("client.delete", self, {"memory_id": memory_id, "sync_type": "sync"})
-        return response.json()
+        return decode_json(response)
 
     @api_error_handler
     def delete_all(self, **kwargs: Any) -> dict[str, str]:
@@ -378,7 +405,7 @@ class MemoryClient:
             self,
             {"keys": list(kwargs.keys()), "sync_type": "sync"},
         )
-        return response.json()
+        return decode_json(response)
 
     @api_error_handler
     def history(self, memory_id: str) -> list[dict[str, Any]]:
@@ -402,7 +429,7 @@ class MemoryClient:
         response = self.client.get(f"/v1/memories/{memory_id}/history/", params=params)
         response.raise_for_status()
         capture_client_event("client.history", self, {"memory_id": memory_id, "sync_type": "sync"})
-        return response.json()
+        return decode_json(response)
 
     @api_error_handler
     def users(self) -> dict[str, Any]:
@@ -411,7 +438,7 @@ class MemoryClient:
         response = self.client.get("/v1/entities/", params=params)
         response.raise_for_status()
         capture_client_event("client.users", self, {"sync_type": "sync"})
-        return response.json()
+        return decode_json(response)
 
     @api_error_handler
     def delete_users(
@@ -528,7 +555,7 @@ class MemoryClient:
         response.raise_for_status()
 
         capture_client_event("client.batch_update", self, {"sync_type": "sync"})
-        return response.json()
+        return decode_json(response)
 
     @api_error_handler
     def batch_delete(self, memories: list[dict[str, Any]]) -> dict[str, Any]:
@@ -554,7 +581,7 @@ class MemoryClient:
         response.raise_for_status()
 
         capture_client_event("client.batch_delete", self, {"sync_type": "sync"})
-        return response.json()
+        return decode_json(response)
 
     @api_error_handler
     def create_memory_export(self, schema: str, **kwargs: Any) -> dict[str, Any]:
@@ -581,7 +608,7 @@ class MemoryClient:
                 "sync_type": "sync",
             },
         )
-        return response.json()
+        return decode_json(response)
 
     @api_error_handler
     def get_memory_export(self, **kwargs: Any) -> dict[str, Any]:
@@ -600,7 +627,7 @@ class MemoryClient:
             self,
             {"keys": list(kwargs.keys()), "sync_type": "sync"},
         )
-        return response.json()
+        return decode_json(response)
 
     @api_error_handler
     def get_summary(self, filters: Optional[dict[str, Any]] = None) -> dict[str, Any]:
@@ -616,7 +643,7 @@ class MemoryClient:
         response = self.client.post("/v1/summary/", json=self._prepare_params({"filters": filters}))
         response.raise_for_status()
         capture_client_event("client.get_summary", self, {"sync_type": "sync"})
-        return response.json()
+        return decode_json(response)
 
     @api_error_handler
     def get_project(self, fields: Optional[list[str]] = None) -> dict[str, Any]:
@@ -654,7 +681,7 @@ class MemoryClient:
             self,
             {"fields": fields, "sync_type": "sync"},
         )
-        return response.json()
+        return decode_json(response)
 
     @api_error_handler
     def update_project(
@@ -692,32 +719,31 @@ class MemoryClient:
         if not (self.org_id and self.project_id):
             raise ValueError("org_id and project_id must be set to update instructions or categories")
 
-        if (
-            custom_instructions is None
-            and custom_categories is None
-            and retrieval_criteria is None
-            and enable_graph is None
-            and version is None
-        ):
+        # Build the update fields and check that there is at least one in a single pass
+        fields: dict[str, Any] = {
+            key: value
+            for key, value in (
+                ("custom_instructions", custom_instructions),
+                ("custom_categories", custom_categories),
+                ("retrieval_criteria", retrieval_criteria),
+                ("enable_graph", enable_graph),
+                ("version", version),
+            )
+            if value is not None
+        }
+        if not fields:
             raise ValueError(
                 "Currently we only support updating custom_instructions or "
                 + "custom_categories or retrieval_criteria, so you must provide at least one of them"
             )
 
-        payload = self._prepare_params(
-            {
-                "custom_instructions": custom_instructions,
-                "custom_categories": custom_categories,
-                "retrieval_criteria": retrieval_criteria,
-                "enable_graph": enable_graph,
-                "version": version,
-            }
-        )
+        payload = self._prepare_params(fields)
         response = self.client.patch(
             f"/api/v1/orgs/organizations/{self.org_id}/projects/{self.project_id}/",
             json=payload,
         )
         response.raise_for_status()
+        self.project.clear_cache()
         capture_client_event(
             "client.update_project",
             self,
@@ -730,7 +756,7 @@ class MemoryClient:
                 "sync_type": "sync",
             },
         )
-        return response.json()
+        return decode_json(response)
 
     def chat(self) -> NoReturn:
         """Start a chat with the Mem0 AI. (Not implemented)
@@ -763,7 +789,7 @@ class MemoryClient:
         response = self.client.get(f"api/v1/webhooks/projects/{project_id}/")
         response.raise_for_status()
         capture_client_event("client.get_webhook", self, {"sync_type": "sync"})
-        return response.json()
+        return decode_json(response)
 
     @api_error_handler
     def create_webhook(self, url: str, name: str, project_id: str, event_types: list[str]) -> dict[str, Any]:
@@ -791,7 +817,7 @@ class MemoryClient:
         response = self.client.post(f"api/v1/webhooks/projects/{project_id}/", json=payload)
         response.raise_for_status()
         capture_client_event("client.create_webhook", self, {"sync_type": "sync"})
-        return response.json()
+        return decode_json(response)
 
     @api_error_handler
     def update_webhook(
@@ -825,7 +851,7 @@ class MemoryClient:
         response = self.client.put(f"api/v1/webhooks/{webhook_id}/", json=payload)
         response.raise_for_status()
         capture_client_event("client.update_webhook", self, {"webhook_id": webhook_id, "sync_type": "sync"})
-        return response.json()
+        return decode_json(response)
 
     @api_error_handler
     def delete_webhook(self, webhook_id: int) -> dict[str, str]:
@@ -853,7 +879,7 @@ class MemoryClient:
             self,
             {"webhook_id": webhook_id, "sync_type": "sync"},
         )
-        return response.json()
+        return decode_json(response)
 
     @api_error_handler
     def feedback(
@@ -877,7 +903,7 @@ class MemoryClient:
         response = self.client.post("/v1/feedback/", json=data)
         response.raise_for_status()
         capture_client_event("client.feedback", self, {**data, "sync_type": "sync"})
-        return response.json()
+        return decode_json(response)
 
     def _prepare_payload(self, messages: list[dict[str, str]], kwargs: dict[str, Any]) -> dict[str, Any]:
         """Prepare the payload for API requests.
@@ -926,6 +952,9 @@ class AsyncMemoryClient:
 
     This class provides asynchronous versions of all MemoryClient methods.
     It uses httpx.AsyncClient for making non-blocking API requests.
+
+    For maximum throughput on Linux/macOS, run your entry point with
+    `memorylake.mem0.run_with_uvloop(...)` instead of `asyncio.run(...)`.
     """
 
     api_key: Optional[str]
@@ -943,6 +972,7 @@ class AsyncMemoryClient:
         org_id: Optional[str] = None,
         project_id: Optional[str] = None,
         client: Optional[httpx.AsyncClient] = None,
+        shared_transport: bool = False,
     ):
         """Initialize the AsyncMemoryClient.
 
@@ -957,11 +987,17 @@ class AsyncMemoryClient:
             client: A custom httpx.AsyncClient instance. If provided, it will
                     be used instead of creating a new one. Note that base_url
                     and headers will be set/overridden as needed.
+            shared_transport: If True (and no client is given), use the running
+                    event loop's transport from get_shared_async_transport(),
+                    so that several clients on the same event loop share one
+                    connection pool. The client must then be created inside
+                    that event loop.
 
         Raises:
             ValueError: If no API key is provided or found in the environment.
+            RuntimeError: If shared_transport is True and there is no running event loop.
         """
-        self.api_key = api_key or os.getenv("MEM0_API_KEY")
+        self.api_key = api_key or os.environ.get("MEM0_API_KEY")
         self.host = host or "https://api.mem0.ai"
         self.org_id = org_id
         self.project_id = project_id
@@ -971,12 +1007,20 @@ class AsyncMemoryClient:
 
         if client is not None:
             self.async_client = client
-            # Ensure the client has the correct base_url and headers
-            self.async_client.base_url = httpx.URL(self.host)
-            self.async_client.headers.update(
-                {
+            # Ensure the client has the correct base_url and headers, only touching them if they differ
+            if str(self.async_client.base_url).rstrip("/") != self.host.rstrip("/"):
+                self.async_client.base_url = httpx.URL(self.host)
+            authorization: str = f"Token {self.api_key}"
+            if self.async_client.headers.get("Authorization") != authorization:
+                self.async_client.headers["Authorization"] = authorization
+        elif shared_transport:
+            self.async_client = httpx.AsyncClient(
+                base_url=self.host,
+                headers={
                     "Authorization": f"Token {self.api_key}",
-                }
+                },
+                timeout=_HTTP_TIMEOUT,
+                transport=get_shared_async_transport(),
             )
         else:
             self.async_client = httpx.AsyncClient(
@@ -984,7 +1028,9 @@ class AsyncMemoryClient:
                 headers={
                     "Authorization": f"Token {self.api_key}",
                 },
-                timeout=300,
+                timeout=_HTTP_TIMEOUT,
+                http2=True,
+                limits=_HTTP_LIMITS,
             )
 
         self.user_email = self._validate_api_key()
@@ -1010,7 +1056,7 @@ class AsyncMemoryClient:
                 },
                 params=params,
             )
-            data = response.json()
+            data = decode_json(response)
 
             response.raise_for_status()
 
@@ -1106,7 +1152,7 @@ class AsyncMemoryClient:
         if "metadata" in kwargs:
             del kwargs["metadata"]
         capture_client_event("client.add", self, {"keys": list(kwargs.keys()), "sync_type": "async"})
-        return response.json()
+        return decode_json(response)
 
     @api_error_handler
     async def get(self, memory_id: str) -> dict[str, Any]:
@@ -1114,7 +1160,59 @@ class AsyncMemoryClient:
         response = await self.async_client.get(f"/v1/memories/{memory_id}/", params=params)
         response.raise_for_status()
         capture_client_event("client.get", self, {"memory_id": memory_id, "sync_type": "async"})
-        return response.json()
+        return decode_json(response)
+
+    async def get_many(self, memory_ids: list[str], concurrency: int = 16) -> list[dict[str, Any]]:
+        """Retrieve several memories by ID, with up to `concurrency` requests in flight at once.
+
+        The cap keeps a large batch from flooding the API (and the connection pool);
+        results are returned in the same order as `memory_ids`. As soon as one request
+        fails, the remaining ones are cancelled and the failure is raised.
+
+        Args:
+            memory_ids: The IDs of the memories to retrieve.
+            concurrency: Maximum number of concurrent requests.
+
+        Returns:
+            A list of dictionaries containing the memory data.
+
+        Raises:
+            ValueError: If concurrency is less than 1.
+            The same exceptions as get(); the first failure is raised.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def get_one(memory_id: str) -> dict[str, Any]:
+            async with semaphore:
+                return await self.get(memory_id)
+
+        if not memory_ids:
+            return []
+
+        tasks: list[asyncio.Task[dict[str, Any]]] = [asyncio.ensure_future(get_one(memory_id)) for memory_id in memory_ids]
+        try:
+            _, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+        except BaseException:
+            # The caller was cancelled: do not leave the lookups running
+            for task in tasks:
+                task.cancel()
+            raise
+
+        if pending:
+            # A lookup failed: cancel the rest instead of sending requests whose results would be discarded
+            for task in pending:
+                task.cancel()
+            await asyncio.wait(pending)
+
+        # Collect every error (so none is reported as never retrieved), and raise the first one in request order
+        errors: list[Optional[BaseException]] = [None if task.cancelled() else task.exception() for task in tasks]
+        for error in errors:
+            if error is not None:
+                raise error
+        return [task.result() for task in tasks]
 
     @api_error_handler
     async def get_all(self, **kwargs: Any) -> dict[str, Any]:
@@ -1141,13 +1239,56 @@ class AsyncMemoryClient:
                 "sync_type": "async",
             },
         )
-        result = response.json()
+        result = decode_json(response)
 
         # Ensure v1.1 format (wrap raw list if needed)
         if isinstance(result, list):
             return {"results": result}
         return result
 
+    async def iter_all(self, page_size: int = 100, **kwargs: Any) -> AsyncGenerator[dict[str, Any], None]:
+        """Iterate over all memories one at a time, fetching them page by page.
+
+        Only one page is held in memory at a time, and the next page is requested
+        while the caller is still consuming the current one.
+
+        Args:
+            page_size: Number of memories to request per page.
+            **kwargs: The same filtering parameters as get_all(), except page and page_size.
+
+        Yields:
+            The memories, in the order returned by the API.
+
+        Raises:
+            ValueError: If page_size is less than 1.
+            The same exceptions as get_all().
+        """
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1")
+
+        page: int = 1
+        next_page: Optional[asyncio.Future[dict[str, Any]]] = asyncio.ensure_future(
+            self.get_all(page=page, page_size=page_size, **kwargs)
+        )
+        try:
+            while next_page is not None:
+                data: dict[str, Any] = await next_page
+                results: list[dict[str, Any]] = data.get("results") or []
+
+                # Follow the "next" link if the API gives one, otherwise stop at the first short page
+                has_more: bool = bool(data["next"]) if "next" in data else len(results) >= page_size
+                next_page = None
+                if has_more and results:
+                    page += 1
+                    next_page = asyncio.ensure_future(self.get_all(page=page, page_size=page_size, **kwargs))
+
+                for memory in results:
+                    yield memory
+        finally:
+            # The caller may stop early: do not leave a prefetch running
+            if next_page is not None:
+                next_page.cancel()
+
     @api_error_handler
     async def search(self, query: str, **kwargs: Any) -> dict[str, Any]:
         payload = {"query": query}
@@ -1169,7 +1310,7 @@ class AsyncMemoryClient:
                 "sync_type": "async",
             },
         )
-        result = response.json()
+        result = decode_json(response)
 
         # Ensure v1.1 format (wrap raw list if needed)
         if isinstance(result, list):
@@ -1207,7 +1348,7 @@ class AsyncMemoryClient:
         params = self._prepare_params()
         response = await self.async_client.put(f"/v1/memories/{memory_id}/", json=payload, params=params)
         response.raise_for_status()
-        return response.json()
+        return decode_json(response)
 
     @api_error_handler
     async def delete(self, memory_id: str) -> dict[str, Any]:
@@ -1231,7 +1372,7 @@ class AsyncMemoryClient:
         response = await self.async_client.delete(f"/v1/memories/{memory_id}/", params=params)
         response.raise_for_status()
         capture_client_event("client.delete", self, {"memory_id": memory_id, "sync_type": "async"})
-        return response.json()
+        return decode_json(response)
 
     @api_error_handler
     async def delete_all(self, **kwargs: Any) -> dict[str, str]:
@@ -1255,7 +1396,7 @@ class AsyncMemoryClient:
         response = await self.async_client.delete("/v1/memories/", params=params)
         response.raise_for_status()
         capture_client_event("client.delete_all", self, {"keys": list(kwargs.keys()), "sync_type": "async"})
-        return response.json()
+        return decode_json(response)
 
     @api_error_handler
     async def history(self, memory_id: str) -> list[dict[str, Any]]:
@@ -1279,7 +1420,7 @@ class AsyncMemoryClient:
         response = await self.async_client.get(f"/v1/memories/{memory_id}/history/", params=params)
         response.raise_for_status()
         capture_client_event("client.history", self, {"memory_id": memory_id, "sync_type": "async"})
-        return response.json()
+        return decode_json(response)
 
     @api_error_handler
     async def users(self) -> dict[str, Any]:
@@ -1288,7 +1429,7 @@ class AsyncMemoryClient:
         response = await self.async_client.get("/v1/entities/", params=params)
         response.raise_for_status()
         capture_client_event("client.users", self, {"sync_type": "async"})
-        return response.json()
+        return decode_json(response)
 
     @api_error_handler
     async def delete_users(
@@ -1404,7 +1545,7 @@ class AsyncMemoryClient:
         response.raise_for_status()
 
         capture_client_event("client.batch_update", self, {"sync_type": "async"})
-        return response.json()
+        return decode_json(response)
 
     @api_error_handler
     async def batch_delete(self, memories: list[dict[str, Any]]) -> dict[str, Any]:
@@ -1430,7 +1571,7 @@ class AsyncMemoryClient:
         response.raise_for_status()
 
         capture_client_event("client.batch_delete", self, {"sync_type": "async"})
-        return response.json()
+        return decode_json(response)
 
     @api_error_handler
     async def create_memory_export(self, schema: str, **kwargs: Any) -> dict[str, Any]:
@@ -1448,7 +1589,7 @@ class AsyncMemoryClient:
         capture_client_event(
             "client.create_memory_export", self, {"schema": schema, "keys": list(kwargs.keys()), "sync_type": "async"}
         )
-        return response.json()
+        return decode_json(response)
 
     @api_error_handler
     async def get_memory_export(self, **kwargs: Any) -> dict[str, Any]:
@@ -1463,7 +1604,7 @@ class AsyncMemoryClient:
         response = await self.async_client.post("/v1/exports/get/", json=self._prepare_params(kwargs))
         response.raise_for_status()
         capture_client_event("client.get_memory_export", self, {"keys": list(kwargs.keys()), "sync_type": "async"})
-        return response.json()
+        return decode_json(response)
 
     @api_error_handler
     async def get_summary(self, filters: Optional[dict[str, Any]] = None) -> dict[str, Any]:
@@ -1479,7 +1620,7 @@ class AsyncMemoryClient:
         response = await self.async_client.post("/v1/summary/", json=self._prepare_params({"filters": filters}))
         response.raise_for_status()
         capture_client_event("client.get_summary", self, {"sync_type": "async"})
-        return response.json()
+        return decode_json(response)
 
     @api_error_handler
     async def get_project(self, fields: Optional[list[str]] = None) -> dict[str, Any]:
@@ -1513,7 +1654,7 @@ class AsyncMemoryClient:
         )
         response.raise_for_status()
         capture_client_event("client.get_project", self, {"fields": fields, "sync_type": "async"})
-        return response.json()
+        return decode_json(response)
 
     @api_error_handler
     async def update_project(
@@ -1551,31 +1692,30 @@ class AsyncMemoryClient:
         if not (self.org_id and self.project_id):
             raise ValueError("org_id and project_id must be set to update instructions or categories")
 
-        if (
-            custom_instructions is None
-            and custom_categories is None
-            and retrieval_criteria is None
-            and enable_graph is None
-            and version is None
-        ):
+        # Build the update fields and check that there is at least one in a single pass
+        fields: dict[str, Any] = {
+            key: value
+            for key, value in (
+                ("custom_instructions", custom_instructions),
+                ("custom_categories", custom_categories),
+                ("retrieval_criteria", retrieval_criteria),
+                ("enable_graph", enable_graph),
+                ("version", version),
+            )
+            if value is not None
+        }
+        if not fields:
             raise ValueError(
                 "Currently we only support updating custom_instructions or custom_categories or retrieval_criteria, so you must provide at least one of them"
             )
 
-        payload = self._prepare_params(
-            {
-                "custom_instructions": custom_instructions,
-                "custom_categories": custom_categories,
-                "retrieval_criteria": retrieval_criteria,
-                "enable_graph": enable_graph,
-                "version": version,
-            }
-        )
+        payload = self._prepare_params(fields)
         response = await self.async_client.patch(
             f"/api/v1/orgs/organizations/{self.org_id}/projects/{self.project_id}/",
             json=payload,
         )
         response.raise_for_status()
+        self.project.clear_cache()
         capture_client_event(
             "client.update_project",
             self,
@@ -1588,7 +1728,7 @@ class AsyncMemoryClient:
                 "sync_type": "async",
             },
         )
-        return response.json()
+        return decode_json(response)
 
     async def chat(self) -> NoReturn:
         """Start a chat with the Mem0 AI. (Not implemented)
@@ -1621,7 +1761,7 @@ class AsyncMemoryClient:
         response = await self.async_client.get(f"api/v1/webhooks/projects/{project_id}/")
         response.raise_for_status()
         capture_client_event("client.get_webhook", self, {"sync_type": "async"})
-        return response.json()
+        return decode_json(response)
 
     @api_error_handler
     async def create_webhook(self, url: str, name: str, project_id: str, event_types: list[str]) -> dict[str, Any]:
@@ -1649,7 +1789,7 @@ class AsyncMemoryClient:
         response = await self.async_client.post(f"api/v1/webhooks/projects/{project_id}/", json=payload)
         response.raise_for_status()
         capture_client_event("client.create_webhook", self, {"sync_type": "async"})
-        return response.json()
+        return decode_json(response)
 
     @api_error_handler
     async def update_webhook(
@@ -1683,7 +1823,7 @@ class AsyncMemoryClient:
         response = await self.async_client.put(f"api/v1/webhooks/{webhook_id}/", json=payload)
         response.raise_for_status()
         capture_client_event("client.update_webhook", self, {"webhook_id": webhook_id, "sync_type": "async"})
-        return response.json()
+        return decode_json(response)
 
     @api_error_handler
     async def delete_webhook(self, webhook_id: int) -> dict[str, str]:
@@ -1707,7 +1847,7 @@ class AsyncMemoryClient:
         response = await self.async_client.delete(f"api/v1/webhooks/{webhook_id}/")
         response.raise_for_status()
         capture_client_event("client.delete_webhook", self, {"webhook_id": webhook_id, "sync_type": "async"})
-        return response.json()
+        return decode_json(response)
 
     @api_error_handler
     async def feedback(
@@ -1724,4 +1864,4 @@ class AsyncMemoryClient:
         response = await self.async_client.post("/v1/feedback/", json=data)
         response.raise_for_status()
         capture_client_event("client.feedback", self, {**data, "sync_type": "async"})
-        return response.json()
+        return decode_json(response)
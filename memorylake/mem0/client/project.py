@@ -1,11 +1,14 @@
+import asyncio
+import copy
 import logging
+import time
 from abc import ABC
 from typing import Any, ClassVar, Optional
 
 import httpx
 from pydantic import BaseModel, ConfigDict, Field
 
-from memorylake.mem0.client.utils import api_error_handler
+from memorylake.mem0.client.utils import api_error_handler, decode_json
 from memorylake.mem0.memory.telemetry import capture_client_event
 
 # Exception classes are referenced in docstrings only
@@ -21,6 +24,11 @@ class ProjectConfig(BaseModel):
     org_id: Optional[str] = Field(default=None, description="Organization ID")
     project_id: Optional[str] = Field(default=None, description="Project ID")
     user_email: Optional[str] = Field(default=None, description="User email")
+    cache_ttl: Optional[float] = Field(
+        default=None,
+        ge=0,
+        description="Seconds to cache project details returned by get(); disabled when unset or 0",
+    )
 
     model_config: ClassVar[ConfigDict] = ConfigDict(validate_assignment=True, extra="forbid")
 
@@ -30,8 +38,12 @@ class BaseProject(ABC):
     Abstract base class for project management operations.
     """
 
+    __slots__: tuple[str, ...] = ("_client", "config", "_cache", "_cache_generation")
+
     _client: Any
     config: ProjectConfig
+    _cache: dict[tuple[Any, ...], tuple[float, dict[str, Any]]]
+    _cache_generation: int
 
     def __init__(
         self,
@@ -60,6 +72,11 @@ class BaseProject(ABC):
             # Create config from parameters
             self.config = ProjectConfig(org_id=org_id, project_id=project_id, user_email=user_email)
 
+        # Cached get() responses, keyed by (org_id, project_id, fields), with the time they were fetched
+        self._cache = {}
+        # Bumped by clear_cache(), so that responses to requests sent before it are not cached
+        self._cache_generation = 0
+
     @property
     def org_id(self) -> Optional[str]:
         """Get the organization ID."""
@@ -75,6 +92,48 @@ class BaseProject(ABC):
         """Get the user email."""
         return self.config.user_email
 
+    def _get_projects_url(self) -> str:
+        """Get the URL of the organization's project collection."""
+        return f"/api/v1/orgs/organizations/{self.config.org_id}/projects/"
+
+    def _get_project_url(self) -> str:
+        """Get the URL of the current project."""
+        return f"/api/v1/orgs/organizations/{self.config.org_id}/projects/{self.config.project_id}/"
+
+    def _get_project_members_url(self) -> str:
+        """Get the URL of the current project's members."""
+        return f"/api/v1/orgs/organizations/{self.config.org_id}/projects/{self.config.project_id}/members/"
+
+    def clear_cache(self) -> None:
+        """Drop all cached project details, so the next get() goes to the API."""
+        self._cache.clear()
+        self._cache_generation += 1
+
+    def _cache_key(self, fields: Optional[list[str]]) -> tuple[Any, ...]:
+        return (self.config.org_id, self.config.project_id, None if fields is None else tuple(fields))
+
+    def _get_cached(self, key: tuple[Any, ...]) -> Optional[dict[str, Any]]:
+        """
+        Return a copy of the cached project details for the key, or None if caching is off or the entry is stale.
+        """
+        cache_ttl: Optional[float] = self.config.cache_ttl
+        if not cache_ttl:
+            return None
+
+        entry: Optional[tuple[float, dict[str, Any]]] = self._cache.get(key)
+        if entry is None or time.monotonic() - entry[0] >= cache_ttl:
+            return None
+
+        # Hand out a copy, so callers cannot mutate the cached response
+        return copy.deepcopy(entry[1])
+
+    def _set_cached(self, key: tuple[Any, ...], data: dict[str, Any], generation: int) -> None:
+        """
+        Cache the project details for the key, unless the cache was cleared since the request was sent (at `generation`).
+        """
+        if self.config.cache_ttl and generation == self._cache_generation:
+            self._cache[key] = (time.monotonic(), copy.deepcopy(data))
+
     def _validate_org_project(self) -> None:
         """
         Validate that both org_id and project_id are set.
@@ -140,6 +199,8 @@ class Project(BaseProject):
     Synchronous project management operations.
     """
 
+    __slots__: tuple[str, ...] = ()
+
     def __init__(
         self,
         client: httpx.Client,
@@ -166,6 +227,9 @@ class Project(BaseProject):
         """
         Get project details.
 
+        If `config.cache_ttl` is set, responses are cached for that many seconds
+        and the cache is cleared by update() and delete().
+
         Args:
             fields: List of fields to retrieve
 
@@ -179,9 +243,15 @@ class Project(BaseProject):
             NetworkError: If network connectivity issues occur.
             ValueError: If org_id or project_id are not set.
         """
+        cache_key = self._cache_key(fields)
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            return cached
+
+        generation = self._cache_generation
         params = self._prepare_params({"fields": fields})
         response = self._client.get(
-            f"/api/v1/orgs/organizations/{self.config.org_id}/projects/{self.config.project_id}/",
+            self._get_project_url(),
             params=params,
         )
         response.raise_for_status()
@@ -190,7 +260,9 @@ class Project(BaseProject):
             self,
             {"fields": fields, "sync_type": "sync"},
         )
-        return response.json()
+        data = decode_json(response)
+        self._set_cached(cache_key, data, generation)
+        return data
 
     @api_error_handler
     def create(self, name: str, description: Optional[str] = None) -> dict[str, Any]:
@@ -219,7 +291,7 @@ class Project(BaseProject):
             payload["description"] = description
 
         response = self._client.post(
-            f"/api/v1/orgs/organizations/{self.config.org_id}/projects/",
+            self._get_projects_url(),
             json=payload,
         )
         response.raise_for_status()
@@ -228,7 +300,7 @@ class Project(BaseProject):
             self,
             {"name": name, "description": description, "sync_type": "sync"},
         )
-        return response.json()
+        return decode_json(response)
 
     @api_error_handler
     def update(
@@ -257,30 +329,30 @@ class Project(BaseProject):
             NetworkError: If network connectivity issues occur.
             ValueError: If org_id or project_id are not set.
         """
-        if (
-            custom_instructions is None
-            and custom_categories is None
-            and retrieval_criteria is None
-            and enable_graph is None
-        ):
+        # Build the update fields and check that there is at least one in a single pass
+        fields: dict[str, Any] = {
+            key: value
+            for key, value in (
+                ("custom_instructions", custom_instructions),
+                ("custom_categories", custom_categories),
+                ("retrieval_criteria", retrieval_criteria),
+                ("enable_graph", enable_graph),
+            )
+            if value is not None
+        }
+        if not fields:
             raise ValueError(
                 "At least one parameter must be provided for update: "
                 + "custom_instructions, custom_categories, retrieval_criteria, enable_graph"
             )
 
-        payload = self._prepare_params(
-            {
-                "custom_instructions": custom_instructions,
-                "custom_categories": custom_categories,
-                "retrieval_criteria": retrieval_criteria,
-                "enable_graph": enable_graph,
-            }
-        )
+        payload = self._prepare_params(fields)
         response = self._client.patch(
-            f"/api/v1/orgs/organizations/{self.config.org_id}/projects/{self.config.project_id}/",
+            self._get_project_url(),
             json=payload,
         )
         response.raise_for_status()
+        self.clear_cache()
         capture_client_event(
             "client.project.update",
             self,
@@ -292,7 +364,7 @@ class Project(BaseProject):
                 "sync_type": "sync",
             },
         )
-        return response.json()
+        return decode_json(response)
 
     @api_error_handler
     def delete(self) -> dict[str, Any]:
@@ -310,15 +382,16 @@ class Project(BaseProject):
             ValueError: If org_id or project_id are not set.
         """
         response = self._client.delete(
-            f"/api/v1/orgs/organizations/{self.config.org_id}/projects/{self.config.project_id}/",
+            self._get_project_url(),
         )
         response.raise_for_status()
+        self.clear_cache()
         capture_client_event(
             "client.project.delete",
             self,
             {"sync_type": "sync"},
         )
-        return response.json()
+        return decode_json(response)
 
     @api_error_handler
     def get_members(self) -> dict[str, Any]:
@@ -336,7 +409,7 @@ class Project(BaseProject):
             ValueError: If org_id or project_id are not set.
         """
         response = self._client.get(
-            f"/api/v1/orgs/organizations/{self.config.org_id}/projects/{self.config.project_id}/members/",
+            self._get_project_members_url(),
         )
         response.raise_for_status()
         capture_client_event(
@@ -344,7 +417,7 @@ class Project(BaseProject):
             self,
             {"sync_type": "sync"},
         )
-        return response.json()
+        return decode_json(response)
 
     @api_error_handler
     def add_member(self, email: str, role: str = "READER") -> dict[str, Any]:
@@ -371,7 +444,7 @@ class Project(BaseProject):
         payload = {"email": email, "role": role}
 
         response = self._client.post(
-            f"/api/v1/orgs/organizations/{self.config.org_id}/projects/{self.config.project_id}/members/",
+            self._get_project_members_url(),
             json=payload,
         )
         response.raise_for_status()
@@ -380,7 +453,7 @@ class Project(BaseProject):
             self,
             {"email": email, "role": role, "sync_type": "sync"},
         )
-        return response.json()
+        return decode_json(response)
 
     @api_error_handler
     def update_member(self, email: str, role: str) -> dict[str, Any]:
@@ -407,7 +480,7 @@ class Project(BaseProject):
         payload = {"email": email, "role": role}
 
         response = self._client.put(
-            f"/api/v1/orgs/organizations/{self.config.org_id}/projects/{self.config.project_id}/members/",
+            self._get_project_members_url(),
             json=payload,
         )
         response.raise_for_status()
@@ -416,7 +489,7 @@ class Project(BaseProject):
             self,
             {"email": email, "role": role, "sync_type": "sync"},
         )
-        return response.json()
+        return decode_json(response)
 
     @api_error_handler
     def remove_member(self, email: str) -> dict[str, Any]:
@@ -439,7 +512,7 @@ class Project(BaseProject):
         params = {"email": email}
 
         response = self._client.delete(
-            f"/api/v1/orgs/organizations/{self.config.org_id}/projects/{self.config.project_id}/members/",
+            self._get_project_members_url(),
             params=params,
         )
         response.raise_for_status()
@@ -448,7 +521,7 @@ class Project(BaseProject):
             self,
             {"email": email, "sync_type": "sync"},
         )
-        return response.json()
+        return decode_json(response)
 
 
 class AsyncProject(BaseProject):
@@ -456,6 +529,10 @@ class AsyncProject(BaseProject):
     Asynchronous project management operations.
     """
 
+    __slots__: tuple[str, ...] = ("_cache_locks",)
+
+    _cache_locks: dict[tuple[Any, ...], asyncio.Lock]
+
     def __init__(
         self,
         client: httpx.AsyncClient,
@@ -476,12 +553,17 @@ class AsyncProject(BaseProject):
         """
         super().__init__(client, config, org_id, project_id, user_email)
         self._validate_org_project()
+        # One lock per cache key, kept across clear_cache(), since an in-flight get() may still hold it
+        self._cache_locks = {}
 
     @api_error_handler
     async def get(self, fields: Optional[list[str]] = None) -> dict[str, Any]:
         """
         Get project details.
 
+        If `config.cache_ttl` is set, responses are cached for that many seconds
+        and the cache is cleared by update() and delete().
+
         Args:
             fields: List of fields to retrieve
 
@@ -495,9 +577,27 @@ class AsyncProject(BaseProject):
             NetworkError: If network connectivity issues occur.
             ValueError: If org_id or project_id are not set.
         """
+        cache_key = self._cache_key(fields)
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            return cached
+        if not self.config.cache_ttl:
+            return await self._fetch_project(fields, cache_key)
+
+        # Collapse concurrent misses for the same key into a single in-flight request
+        lock = self._cache_locks.setdefault(cache_key, asyncio.Lock())
+        async with lock:
+            cached = self._get_cached(cache_key)
+            if cached is not None:
+                return cached
+            return await self._fetch_project(fields, cache_key)
+
+    async def _fetch_project(self, fields: Optional[list[str]], cache_key: tuple[Any, ...]) -> dict[str, Any]:
+        """Request the project details from the API and cache them if caching is enabled."""
+        generation = self._cache_generation
         params = self._prepare_params({"fields": fields})
         response = await self._client.get(
-            f"/api/v1/orgs/organizations/{self.config.org_id}/projects/{self.config.project_id}/",
+            self._get_project_url(),
             params=params,
         )
         response.raise_for_status()
@@ -506,7 +606,9 @@ class AsyncProject(BaseProject):
             self,
             {"fields": fields, "sync_type": "async"},
         )
-        return response.json()
+        data = decode_json(response)
+        self._set_cached(cache_key, data, generation)
+        return data
 
     @api_error_handler
     async def create(self, name: str, description: Optional[str] = None) -> dict[str, Any]:
@@ -535,7 +637,7 @@ class AsyncProject(BaseProject):
             payload["description"] = description
 
         response = await self._client.post(
-            f"/api/v1/orgs/organizations/{self.config.org_id}/projects/",
+            self._get_projects_url(),
             json=payload,
         )
         response.raise_for_status()
@@ -544,7 +646,7 @@ class AsyncProject(BaseProject):
             self,
             {"name": name, "description": description, "sync_type": "async"},
         )
-        return response.json()
+        return decode_json(response)
 
     @api_error_handler
     async def update(
@@ -573,30 +675,30 @@ class AsyncProject(BaseProject):
             NetworkError: If network connectivity issues occur.
             ValueError: If org_id or project_id are not set.
         """
-        if (
-            custom_instructions is None
-            and custom_categories is None
-            and retrieval_criteria is None
-            and enable_graph is None
-        ):
+        # Build the update fields and check that there is at least one in a single pass
+        fields: dict[str, Any] = {
+            key: value
+            for key, value in (
+                ("custom_instructions", custom_instructions),
+                ("custom_categories", custom_categories),
+                ("retrieval_criteria", retrieval_criteria),
+                ("enable_graph", enable_graph),
+            )
+            if value is not None
+        }
+        if not fields:
             raise ValueError(
                 "At least one parameter must be provided for update: "
                 + "custom_instructions, custom_categories, retrieval_criteria, enable_graph"
             )
 
-        payload = self._prepare_params(
-            {
-                "custom_instructions": custom_instructions,
-                "custom_categories": custom_categories,
-                "retrieval_criteria": retrieval_criteria,
-                "enable_graph": enable_graph,
-            }
-        )
+        payload = self._prepare_params(fields)
         response = await self._client.patch(
-            f"/api/v1/orgs/organizations/{self.config.org_id}/projects/{self.config.project_id}/",
+            self._get_project_url(),
             json=payload,
         )
         response.raise_for_status()
+        self.clear_cache()
         capture_client_event(
             "client.project.update",
             self,
@@ -608,7 +710,7 @@ class AsyncProject(BaseProject):
                 "sync_type": "async",
             },
         )
-        return response.json()
+        return decode_json(response)
 
     @api_error_handler
     async def delete(self) -> dict[str, Any]:
@@ -626,15 +728,16 @@ class AsyncProject(BaseProject):
             ValueError: If org_id or project_id are not set.
         """
         response = await self._client.delete(
-            f"/api/v1/orgs/organizations/{self.config.org_id}/projects/{self.config.project_id}/",
+            self._get_project_url(),
         )
         response.raise_for_status()
+        self.clear_cache()
         capture_client_event(
             "client.project.delete",
             self,
             {"sync_type": "async"},
         )
-        return response.json()
+        return decode_json(response)
 
     @api_error_handler
     async def get_members(self) -> dict[str, Any]:
@@ -652,7 +755,7 @@ class AsyncProject(BaseProject):
             ValueError: If org_id or project_id are not set.
         """
         response = await self._client.get(
-            f"/api/v1/orgs/organizations/{self.config.org_id}/projects/{self.config.project_id}/members/",
+            self._get_project_members_url(),
         )
         response.raise_for_status()
         capture_client_event(
@@ -660,7 +763,7 @@ class AsyncProject(BaseProject):
             self,
             {"sync_type": "async"},
         )
-        return response.json()
+        return decode_json(response)
 
     @api_error_handler
     async def add_member(self, email: str, role: str = "READER") -> dict[str, Any]:
@@ -687,7 +790,7 @@ class AsyncProject(BaseProject):
         payload = {"email": email, "role": role}
 
         response = await self._client.post(
-            f"/api/v1/orgs/organizations/{self.config.org_id}/projects/{self.config.project_id}/members/",
+            self._get_project_members_url(),
             json=payload,
         )
         response.raise_for_status()
@@ -696,7 +799,7 @@ class AsyncProject(BaseProject):
             self,
             {"email": email, "role": role, "sync_type": "async"},
         )
-        return response.json()
+        return decode_json(response)
 
     @api_error_handler
     async def update_member(self, email: str, role: str) -> dict[str, Any]:
@@ -723,7 +826,7 @@ class AsyncProject(BaseProject):
         payload = {"email": email, "role": role}
 
         response = await self._client.put(
-            f"/api/v1/orgs/organizations/{self.config.org_id}/projects/{self.config.project_id}/members/",
+            self._get_project_members_url(),
             json=payload,
         )
         response.raise_for_status()
@@ -732,7 +835,7 @@ class AsyncProject(BaseProject):
             self,
             {"email": email, "role": role, "sync_type": "async"},
         )
-        return response.json()
+        return decode_json(response)
 
     @api_error_handler
     async def remove_member(self, email: str) -> dict[str, Any]:
@@ -755,7 +858,7 @@ class AsyncProject(BaseProject):
         params = {"email": email}
 
         response = await self._client.delete(
-            f"/api/v1/orgs/organizations/{self.config.org_id}/projects/{self.config.project_id}/members/",
+            self._get_project_members_url(),
             params=params,
         )
         response.raise_for_status()
@@ -764,4 +867,4 @@ class AsyncProject(BaseProject):
             self,
             {"email": email, "sync_type": "async"},
         )
-        return response.json()
+        return decode_json(response)
@@ -3,10 +3,15 @@ from __future__ import annotations
 import uuid
 from typing import Any, Literal, Optional
 
+import httpx
+
 from memorylake.mem0.client.main import AsyncMemoryClient, MemoryClient
-from memorylake.mem0.client.utils import api_error_handler
+from memorylake.mem0.client.utils import decode_json, handle_http_status_error, handle_request_error
 from memorylake.mem0.memory.telemetry import capture_client_event
 
+_END_CHAT_SESSION_URL: str = "/v3/chat_session/event/"
+_RECOLLECT_URL: str = "/v3/memories/recollect/"
+
 
 class MemoryLakeClient(MemoryClient):
 
@@ -23,7 +28,6 @@ class MemoryLakeClient(MemoryClient):
             memory_client=self,
         )
 
-    @api_error_handler
     def end_chat_session(
         self,
         chat_session_id: str,
@@ -45,14 +49,20 @@ class MemoryLakeClient(MemoryClient):
                 "event_type": "end",
             }
         )
-        response = self.client.post("/v3/chat_session/event/", json=payload)
-        response.raise_for_status()
+        try:
+            response = self.client.post(_END_CHAT_SESSION_URL, json=payload)
+            if not response.is_success:
+                response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            handle_http_status_error(e)
+        except httpx.RequestError as e:
+            handle_request_error(e)
         capture_client_event(
             "client.end_chat_session",
             self,
             {"chat_session_id": chat_session_id, "sync_type": "sync"},
         )
-        return response.json()
+        return decode_json(response)
 
     def prepare_params(self, kwargs: Optional[dict[str, Any]] = None) -> dict[str, Any]:
         return self._prepare_params(kwargs)
@@ -73,7 +83,6 @@ class AsyncMemoryLakeClient(AsyncMemoryClient):
             memory_client=self,
         )
 
-    @api_error_handler
     async def end_chat_session(
         self,
         chat_session_id: str,
@@ -95,14 +104,20 @@ class AsyncMemoryLakeClient(AsyncMemoryClient):
                 "event_type": "end",
             }
         )
-        response = await self.async_client.post("/v3/chat_session/event/", json=payload)
-        response.raise_for_status()
+        try:
+            response = await self.async_client.post(_END_CHAT_SESSION_URL, json=payload)
+            if not response.is_success:
+                response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            handle_http_status_error(e)
+        except httpx.RequestError as e:
+            handle_request_error(e)
         capture_client_event(
             "client.end_chat_session",
             self,
             {"chat_session_id": chat_session_id, "sync_type": "async"},
         )
-        return response.json()
+        return decode_json(response)
 
     def prepare_params(self, kwargs: Optional[dict[str, Any]] = None) -> dict[str, Any]:
         return self._prepare_params(kwargs)
@@ -110,6 +125,14 @@ class AsyncMemoryLakeClient(AsyncMemoryClient):
 
 class Reflection:
 
+    __slots__: tuple[str, ...] = (
+        "user_id",
+        "target_type",
+        "target_id",
+        "memory_client",
+        "reflect_id",
+    )
+
     user_id: str
     target_type: Literal["user", "location"]
     target_id: str
@@ -127,21 +150,26 @@ class Reflection:
         self.target_type = target_type
         self.target_id = target_id
         self.memory_client = memory_client
-        self.reflect_id = str(uuid.uuid4())
+        self.reflect_id = uuid.uuid4().hex
 
-    @api_error_handler
     def recollect(self, **kwargs: Any) -> dict[str, Any]:
         kwargs["user_id"] = self.user_id
         kwargs["metadata"] = self._prepare_metadata(kwargs.get("metadata") or {})
         payload = self.memory_client.prepare_params(kwargs)
-        response = self.memory_client.client.post("/v3/memories/recollect/", json=payload)
-        response.raise_for_status()
+        try:
+            response = self.memory_client.client.post(_RECOLLECT_URL, json=payload)
+            if not response.is_success:
+                response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            handle_http_status_error(e)
+        except httpx.RequestError as e:
+            handle_request_error(e)
         capture_client_event(
             "client.recollect",
             self.memory_client,
             {"reflect_id": self.reflect_id, "sync_type": "sync"},
         )
-        return response.json()
+        return decode_json(response)
 
     def save(self, messages: Any, **kwargs: Any) -> dict[str, Any]:
         kwargs["user_id"] = self.user_id
@@ -167,6 +195,14 @@ class Reflection:
 
 class AsyncReflection:
 
+    __slots__: tuple[str, ...] = (
+        "user_id",
+        "target_type",
+        "target_id",
+        "memory_client",
+        "reflect_id",
+    )
+
     user_id: str
     target_type: Literal["user", "location"]
     target_id: str
@@ -184,21 +220,26 @@ class AsyncReflection:
         self.target_type = target_type
         self.target_id = target_id
         self.memory_client = memory_client
-        self.reflect_id = str(uuid.uuid4())
+        self.reflect_id = uuid.uuid4().hex
 
-    @api_error_handler
     async def recollect(self, **kwargs: Any) -> dict[str, Any]:
         kwargs["user_id"] = self.user_id
         kwargs["metadata"] = self._prepare_metadata(kwargs.get("metadata") or {})
         payload = self.memory_client.prepare_params(kwargs)
-        response = await self.memory_client.async_client.post("/v3/memories/recollect/", json=payload)
-        response.raise_for_status()
+        try:
+            response = await self.memory_client.async_client.post(_RECOLLECT_URL, json=payload)
+            if not response.is_success:
+                response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            handle_http_status_error(e)
+        except httpx.RequestError as e:
+            handle_request_error(e)
         capture_client_event(
             "client.recollect",
             self.memory_client,
             {"reflect_id": self.reflect_id, "sync_type": "async"},
         )
-        return response.json()
+        return decode_json(response)
 
     async def save(self, messages: Any, **kwargs: Any) -> dict[str, Any]:
         kwargs["user_id"] = self.user_id
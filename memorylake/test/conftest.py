@@ -0,0 +1,76 @@
+from collections.abc import AsyncIterator, Coroutine, Iterator
+from typing import Any, Callable, Union
+
+import httpx
+import pytest
+
+from memorylake.mem0.client.main import AsyncMemoryClient, MemoryClient
+
+MOCK_HOST: str = "https://api.example.test"
+
+# A request handler for httpx.MockTransport, either sync or async
+MockHandler = Union[
+    Callable[[httpx.Request], httpx.Response],
+    Callable[[httpx.Request], Coroutine[Any, Any, httpx.Response]],
+]
+
+
+def _ping(request: httpx.Request) -> httpx.Response:
+    _ = request
+    return httpx.Response(200, json={"org_id": "org-1", "project_id": "proj-1", "user_email": "a@b.c"})
+
+
+@pytest.fixture
+def mock_http_client() -> Iterator[Callable[[MockHandler], httpx.Client]]:
+    """Factory of httpx.Client instances served by a MockTransport, closed at teardown."""
+    clients: list[httpx.Client] = []
+
+    def make(handler: MockHandler) -> httpx.Client:
+        client: httpx.Client = httpx.Client(base_url=MOCK_HOST, transport=httpx.MockTransport(handler))
+        clients.append(client)
+        return client
+
+    yield make
+    for client in clients:
+        client.close()
+
+
+@pytest.fixture
+async def mock_async_http_client() -> AsyncIterator[Callable[[MockHandler], httpx.AsyncClient]]:
+    """Factory of httpx.AsyncClient instances served by a MockTransport, closed at teardown."""
+    clients: list[httpx.AsyncClient] = []
+
+    def make(handler: MockHandler) -> httpx.AsyncClient:
+        client: httpx.AsyncClient = httpx.AsyncClient(base_url=MOCK_HOST, transport=httpx.MockTransport(handler))
+        clients.append(client)
+        return client
+
+    yield make
+    for client in clients:
+        await client.aclose()
+
+
+@pytest.fixture
+def mock_memory_client(mock_http_client: Callable[[MockHandler], httpx.Client]) -> Callable[[MockHandler], MemoryClient]:
+    """Factory of MemoryClient instances served by a MockTransport; the handler must also answer /v1/ping/."""
+
+    def make(handler: MockHandler) -> MemoryClient:
+        return MemoryClient(api_key="test-key", host=MOCK_HOST, client=mock_http_client(handler))
+
+    return make
+
+
+@pytest.fixture
+def mock_async_memory_client(
+    monkeypatch: pytest.MonkeyPatch,
+    mock_async_http_client: Callable[[MockHandler], httpx.AsyncClient],
+) -> Callable[[MockHandler], AsyncMemoryClient]:
+    """Factory of AsyncMemoryClient instances served by a MockTransport, closed at teardown."""
+
+    def make(handler: MockHandler) -> AsyncMemoryClient:
+        with httpx.Client(transport=httpx.MockTransport(_ping)) as ping_client:
+            # AsyncMemoryClient validates the API key with a module-level httpx.get() call
+            monkeypatch.setattr(httpx, "get", ping_client.get)
+            return AsyncMemoryClient(api_key="test-key", host=MOCK_HOST, client=mock_async_http_client(handler))
+
+    return make
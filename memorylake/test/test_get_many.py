@@ -0,0 +1,95 @@
+import asyncio
+from typing import Any, Callable, Optional
+
+import httpx
+import pytest
+
+from memorylake.mem0.client.main import AsyncMemoryClient
+from memorylake.mem0.exceptions import MemoryNotFoundError
+
+
+class _MemoryApi:
+    """Serves /v1/memories/<id>/, tracking how many requests are in flight at once."""
+
+    def __init__(self, missing: Optional[frozenset[str]] = None) -> None:
+        self.missing: frozenset[str] = missing or frozenset()
+        self.in_flight: int = 0
+        self.peak_in_flight: int = 0
+        self.started: list[str] = []
+        self.finished: list[str] = []
+        self.cancelled: list[str] = []
+
+    async def respond(self, request: httpx.Request) -> httpx.Response:
+        memory_id: str = request.url.path.rstrip("/").rsplit("/", 1)[-1]
+        self.started.append(memory_id)
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            # Later IDs answer sooner, so completion order differs from request order
+            await asyncio.sleep(0.001 * (20 - int(memory_id)))
+        except asyncio.CancelledError:
+            self.cancelled.append(memory_id)
+            raise
+        finally:
+            self.in_flight -= 1
+        self.finished.append(memory_id)
+        if memory_id in self.missing:
+            return httpx.Response(404, json={"detail": "Memory not found"})
+        return httpx.Response(200, json={"id": memory_id})
+
+
+async def test_get_many_preserves_order(mock_async_memory_client: Callable[..., AsyncMemoryClient]) -> None:
+    api: _MemoryApi = _MemoryApi()
+    client: AsyncMemoryClient = mock_async_memory_client(api.respond)
+    memory_ids: list[str] = [str(i) for i in range(10)]
+
+    memories: list[dict[str, Any]] = await client.get_many(memory_ids)
+
+    assert [memory["id"] for memory in memories] == memory_ids
+    assert api.finished != memory_ids
+
+
+async def test_get_many_caps_concurrency(mock_async_memory_client: Callable[..., AsyncMemoryClient]) -> None:
+    api: _MemoryApi = _MemoryApi()
+    client: AsyncMemoryClient = mock_async_memory_client(api.respond)
+
+    memories: list[dict[str, Any]] = await client.get_many([str(i) for i in range(12)], concurrency=3)
+
+    assert len(memories) == 12
+    assert api.peak_in_flight == 3
+
+
+async def test_get_many_rejects_bad_concurrency(mock_async_memory_client: Callable[..., AsyncMemoryClient]) -> None:
+    api: _MemoryApi = _MemoryApi()
+    client: AsyncMemoryClient = mock_async_memory_client(api.respond)
+
+    with pytest.raises(ValueError):
+        _ = await client.get_many(["1"], concurrency=0)
+    assert api.finished == []
+
+
+async def test_get_many_cancels_siblings_on_failure(mock_async_memory_client: Callable[..., AsyncMemoryClient]) -> None:
+    # "3" answers first among the four in flight, with a 404
+    api: _MemoryApi = _MemoryApi(missing=frozenset({"3"}))
+    client: AsyncMemoryClient = mock_async_memory_client(api.respond)
+    memory_ids: list[str] = [str(i) for i in range(16)]
+
+    with pytest.raises(MemoryNotFoundError):
+        _ = await client.get_many(memory_ids, concurrency=4)
+
+    # The requests in flight were cancelled, and the queued ones were never sent
+    assert api.finished == ["3"]
+    assert sorted(api.cancelled) == sorted(memory_id for memory_id in api.started if memory_id != "3")
+    assert len(api.started) < len(memory_ids)
+
+    # Nothing keeps running in the background
+    await asyncio.sleep(0.05)
+    assert api.finished == ["3"]
+
+
+async def test_get_many_of_nothing(mock_async_memory_client: Callable[..., AsyncMemoryClient]) -> None:
+    api: _MemoryApi = _MemoryApi()
+    client: AsyncMemoryClient = mock_async_memory_client(api.respond)
+
+    assert await client.get_many([]) == []
+    assert api.started == []
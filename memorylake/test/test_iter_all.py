@@ -0,0 +1,100 @@
+import asyncio
+from collections.abc import AsyncGenerator, AsyncIterator
+from typing import Any, Callable, Optional
+
+import httpx
+import pytest
+
+from memorylake.mem0.client.main import AsyncMemoryClient
+
+
+class _PagedApi:
+    """Serves `total` memories from /v2/memories/, optionally with a "next" link on each page."""
+
+    def __init__(self, total: int, with_next: Optional[bool] = None) -> None:
+        self.total: int = total
+        self.with_next: Optional[bool] = with_next
+        self.pages: list[int] = []
+
+    async def respond(self, request: httpx.Request) -> httpx.Response:
+        page: int = int(request.url.params["page"])
+        page_size: int = int(request.url.params["page_size"])
+        self.pages.append(page)
+
+        start: int = (page - 1) * page_size
+        body: dict[str, Any] = {"results": [{"id": str(i)} for i in range(start, min(start + page_size, self.total))]}
+        if self.with_next is not None:
+            body["next"] = f"/v2/memories/?page={page + 1}" if self.with_next and start + page_size < self.total else None
+        return httpx.Response(200, json=body)
+
+
+async def _collect(iterator: AsyncIterator[dict[str, Any]]) -> list[str]:
+    return [memory["id"] async for memory in iterator]
+
+
+async def test_iter_all_yields_every_memory_in_order(mock_async_memory_client: Callable[..., AsyncMemoryClient]) -> None:
+    api: _PagedApi = _PagedApi(total=7)
+    client: AsyncMemoryClient = mock_async_memory_client(api.respond)
+
+    ids: list[str] = await _collect(client.iter_all(page_size=3, user_id="alice"))
+
+    assert ids == [str(i) for i in range(7)]
+    assert api.pages == [1, 2, 3]
+
+
+async def test_iter_all_without_next_link_stops_at_short_page(mock_async_memory_client: Callable[..., AsyncMemoryClient]) -> None:
+    # With an exact multiple of the page size, the last full page is followed by one empty page
+    api: _PagedApi = _PagedApi(total=4)
+    client: AsyncMemoryClient = mock_async_memory_client(api.respond)
+
+    ids: list[str] = await _collect(client.iter_all(page_size=2, user_id="alice"))
+
+    assert ids == ["0", "1", "2", "3"]
+    assert api.pages == [1, 2, 3]
+
+
+async def test_iter_all_follows_next_link(mock_async_memory_client: Callable[..., AsyncMemoryClient]) -> None:
+    # The "next" link takes precedence: no extra request after the last full page
+    api: _PagedApi = _PagedApi(total=4, with_next=True)
+    client: AsyncMemoryClient = mock_async_memory_client(api.respond)
+
+    ids: list[str] = await _collect(client.iter_all(page_size=2, user_id="alice"))
+
+    assert ids == ["0", "1", "2", "3"]
+    assert api.pages == [1, 2]
+
+
+async def test_iter_all_rejects_bad_page_size(mock_async_memory_client: Callable[..., AsyncMemoryClient]) -> None:
+    api: _PagedApi = _PagedApi(total=1)
+    client: AsyncMemoryClient = mock_async_memory_client(api.respond)
+
+    with pytest.raises(ValueError):
+        _ = await _collect(client.iter_all(page_size=0))
+    assert api.pages == []
+
+
+async def test_iter_all_aclose_cancels_prefetch(mock_async_memory_client: Callable[..., AsyncMemoryClient]) -> None:
+    prefetch_started: asyncio.Event = asyncio.Event()
+    prefetch_cancelled: asyncio.Event = asyncio.Event()
+
+    async def respond(request: httpx.Request) -> httpx.Response:
+        if request.url.params["page"] == "1":
+            return httpx.Response(200, json={"results": [{"id": "0"}, {"id": "1"}]})
+        prefetch_started.set()
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            prefetch_cancelled.set()
+            raise
+        raise AssertionError("unreachable")
+
+    client: AsyncMemoryClient = mock_async_memory_client(respond)
+    iterator: AsyncGenerator[dict[str, Any], None] = client.iter_all(page_size=2, user_id="alice")
+
+    async for memory in iterator:
+        assert memory["id"] == "0"
+        _ = await asyncio.wait_for(prefetch_started.wait(), timeout=1)
+        break
+    await iterator.aclose()
+
+    _ = await asyncio.wait_for(prefetch_cancelled.wait(), timeout=1)
@@ -0,0 +1,30 @@
+import asyncio
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from memorylake.mem0 import run_with_uvloop
+
+
+async def _loop_module() -> str:
+    return type(asyncio.get_running_loop()).__module__
+
+
+def _run_in_thread() -> str:
+    # Run in a worker thread, so the main thread's event loop (managed by pytest-asyncio) is left alone
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(run_with_uvloop, _loop_module()).result()
+
+
+def test_run_with_uvloop_uses_uvloop() -> None:
+    _ = pytest.importorskip("uvloop")
+
+    assert _run_in_thread().startswith("uvloop")
+
+
+def test_run_with_uvloop_falls_back_to_asyncio(monkeypatch: pytest.MonkeyPatch) -> None:
+    # A None entry in sys.modules makes `import uvloop` raise ImportError
+    monkeypatch.setitem(sys.modules, "uvloop", None)
+
+    assert _run_in_thread().startswith("asyncio")
@@ -0,0 +1,184 @@
+import asyncio
+from types import SimpleNamespace
+from typing import Any, Callable
+
+import httpx
+import pytest
+
+from memorylake.mem0.client.main import AsyncMemoryClient, MemoryClient
+from memorylake.mem0.client.project import AsyncProject, Project, ProjectConfig
+
+_PROJECT_URL: str = "/api/v1/orgs/organizations/org-1/projects/proj-1/"
+
+
+class _FakeApi:
+    """A tiny in-memory stand-in for the project endpoints, counting the requests it serves."""
+
+    def __init__(self) -> None:
+        self.requests: list[tuple[str, str]] = []
+        self.instructions: str = "v1"
+
+    def respond(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append((request.method, request.url.path))
+        if request.url.path == "/v1/ping/":
+            return httpx.Response(200, json={"org_id": "org-1", "project_id": "proj-1", "user_email": "a@b.c"})
+        if request.url.path != _PROJECT_URL:
+            return httpx.Response(404, json={"detail": "not found"})
+        if request.method == "PATCH":
+            self.instructions = "v2"
+            return httpx.Response(200, json={"message": "updated"})
+        if request.method == "DELETE":
+            return httpx.Response(200, json={"message": "deleted"})
+        return httpx.Response(200, json={"custom_instructions": self.instructions})
+
+    async def respond_later(self, request: httpx.Request) -> httpx.Response:
+        # Yield to the loop, so that concurrent get() calls really overlap
+        await asyncio.sleep(0.01)
+        return self.respond(request)
+
+    def count(self, method: str, path: str = _PROJECT_URL) -> int:
+        return self.requests.count((method, path))
+
+
+def _config(cache_ttl: float = 60.0) -> ProjectConfig:
+    return ProjectConfig(org_id="org-1", project_id="proj-1", cache_ttl=cache_ttl)
+
+
+def test_get_is_served_from_cache(mock_http_client: Callable[..., httpx.Client]) -> None:
+    api: _FakeApi = _FakeApi()
+    project: Project = Project(client=mock_http_client(api.respond), config=_config())
+
+    first: dict[str, Any] = project.get()
+    first["custom_instructions"] = "mutated by the caller"
+    second: dict[str, Any] = project.get()
+
+    assert api.count("GET") == 1
+    assert second == {"custom_instructions": "v1"}
+
+    # Different fields are cached under a different key
+    _ = project.get(fields=["custom_instructions"])
+    assert api.count("GET") == 2
+
+
+def test_get_without_ttl_is_not_cached(mock_http_client: Callable[..., httpx.Client]) -> None:
+    api: _FakeApi = _FakeApi()
+    project: Project = Project(client=mock_http_client(api.respond), config=_config(cache_ttl=0))
+
+    _ = project.get()
+    _ = project.get()
+
+    assert api.count("GET") == 2
+
+
+def test_cache_entry_expires(monkeypatch: pytest.MonkeyPatch, mock_http_client: Callable[..., httpx.Client]) -> None:
+    now: list[float] = [1000.0]
+    monkeypatch.setattr("memorylake.mem0.client.project.time", SimpleNamespace(monotonic=lambda: now[0]))
+    api: _FakeApi = _FakeApi()
+    project: Project = Project(client=mock_http_client(api.respond), config=_config(cache_ttl=10.0))
+
+    _ = project.get()
+    now[0] += 9.0
+    _ = project.get()
+    assert api.count("GET") == 1
+
+    now[0] += 1.0
+    _ = project.get()
+    assert api.count("GET") == 2
+
+
+def test_cache_is_invalidated_by_update_delete_and_clear(mock_http_client: Callable[..., httpx.Client]) -> None:
+    api: _FakeApi = _FakeApi()
+    project: Project = Project(client=mock_http_client(api.respond), config=_config())
+
+    _ = project.get()
+    _ = project.update(custom_instructions="new")
+    assert project.get() == {"custom_instructions": "v2"}
+    assert api.count("GET") == 2
+
+    project.clear_cache()
+    _ = project.get()
+    assert api.count("GET") == 3
+
+    _ = project.delete()
+    _ = project.get()
+    assert api.count("GET") == 4
+
+
+def test_get_in_flight_during_clear_is_not_cached(mock_http_client: Callable[..., httpx.Client]) -> None:
+    api: _FakeApi = _FakeApi()
+    project: Project
+
+    def respond(request: httpx.Request) -> httpx.Response:
+        response: httpx.Response = api.respond(request)
+        if request.method == "GET" and api.count("GET") == 1:
+            # Another thread updates the project while this first request is still in flight
+            project.clear_cache()
+        return response
+
+    project = Project(client=mock_http_client(respond), config=_config())
+
+    _ = project.get()
+    _ = project.get()
+    _ = project.get()
+
+    assert api.count("GET") == 2
+
+
+def test_client_update_project_invalidates_cache(mock_memory_client: Callable[..., MemoryClient]) -> None:
+    api: _FakeApi = _FakeApi()
+    client: MemoryClient = mock_memory_client(api.respond)
+    client.project.config.cache_ttl = 60.0
+
+    _ = client.project.get()
+    _ = client.update_project(custom_instructions="new")
+    assert client.project.get() == {"custom_instructions": "v2"}
+    assert api.count("GET") == 2
+
+
+async def test_async_client_update_project_invalidates_cache(mock_async_memory_client: Callable[..., AsyncMemoryClient]) -> None:
+    api: _FakeApi = _FakeApi()
+    client: AsyncMemoryClient = mock_async_memory_client(api.respond)
+    client.project.config.cache_ttl = 60.0
+
+    _ = await client.project.get()
+    _ = await client.update_project(custom_instructions="new")
+    assert await client.project.get() == {"custom_instructions": "v2"}
+    assert api.count("GET") == 2
+
+
+async def test_async_concurrent_misses_are_coalesced(mock_async_http_client: Callable[..., httpx.AsyncClient]) -> None:
+    api: _FakeApi = _FakeApi()
+    project: AsyncProject = AsyncProject(client=mock_async_http_client(api.respond_later), config=_config())
+
+    results: list[dict[str, Any]] = await asyncio.gather(*(project.get() for _ in range(5)))
+
+    assert api.count("GET") == 1
+    assert results == [{"custom_instructions": "v1"}] * 5
+    # Every caller gets its own copy of the cached response
+    assert len({id(result) for result in results}) == 5
+
+
+async def test_async_get_in_flight_during_update_is_not_cached(mock_async_http_client: Callable[..., httpx.AsyncClient]) -> None:
+    api: _FakeApi = _FakeApi()
+    get_sent: asyncio.Event = asyncio.Event()
+    release_get: asyncio.Event = asyncio.Event()
+
+    async def respond(request: httpx.Request) -> httpx.Response:
+        # The response is built when the request arrives, i.e. before the update below
+        response: httpx.Response = api.respond(request)
+        if request.method == "GET" and not release_get.is_set():
+            get_sent.set()
+            await release_get.wait()
+        return response
+
+    project: AsyncProject = AsyncProject(client=mock_async_http_client(respond), config=_config())
+
+    stale_get: asyncio.Task[dict[str, Any]] = asyncio.ensure_future(project.get())
+    _ = await asyncio.wait_for(get_sent.wait(), timeout=1)
+    _ = await project.update(custom_instructions="new")
+    release_get.set()
+    assert await stale_get == {"custom_instructions": "v1"}
+
+    # The pre-update response must not have been cached
+    assert await project.get() == {"custom_instructions": "v2"}
+    assert api.count("GET") == 2
@@ -0,0 +1,59 @@
+import asyncio
+import os
+import sys
+
+import httpx
+import pytest
+
+from memorylake.mem0.client.utils import get_shared_async_transport, get_shared_transport
+
+
+def test_shared_transport_is_process_wide() -> None:
+    assert get_shared_transport() is get_shared_transport()
+
+
+def test_shared_async_transport_is_per_event_loop() -> None:
+    async def get_twice() -> tuple[httpx.AsyncHTTPTransport, httpx.AsyncHTTPTransport]:
+        return get_shared_async_transport(), get_shared_async_transport()
+
+    def run_on_new_loop() -> tuple[httpx.AsyncHTTPTransport, httpx.AsyncHTTPTransport]:
+        # A private loop, rather than asyncio.run(), so the test leaves the current event loop alone
+        loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(get_twice())
+        finally:
+            loop.close()
+
+    first, again = run_on_new_loop()
+    second, _ = run_on_new_loop()
+
+    assert first is again
+    assert first is not second
+
+
+def test_shared_async_transport_needs_running_loop() -> None:
+    with pytest.raises(RuntimeError):
+        _ = get_shared_async_transport()
+
+
+async def test_shared_async_transport_survives_client_close() -> None:
+    transport: httpx.AsyncHTTPTransport = get_shared_async_transport()
+    async with httpx.AsyncClient(transport=transport):
+        pass
+
+    # Closing one client must not close the pool the other clients on this loop still use
+    assert get_shared_async_transport() is transport
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="os.fork() is not available on Windows")
+def test_shared_transport_is_not_inherited_by_forked_child() -> None:
+    parent_transport: httpx.HTTPTransport = get_shared_transport()
+
+    pid: int = os.fork()
+    if pid == 0:
+        # In the child: report through the exit code, as exceptions must not escape into pytest
+        os._exit(0 if get_shared_transport() is not parent_transport else 1)
+
+    _, status = os.waitpid(pid, 0)
+    assert os.waitstatus_to_exitcode(status) == 0
+    assert get_shared_transport() is parent_transport